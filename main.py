@@ -1,18 +1,39 @@
 import os
+import re
 import json
 import logging
+import subprocess
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple, Dict, Literal
+from typing import List, Tuple, Dict, Optional
 from utils import setup_logging
+import PIL
 from PIL import Image
-from pydub import AudioSegment
-from moviepy.editor import (VideoFileClip, ImageClip, AudioFileClip, 
-                          concatenate_videoclips, CompositeVideoClip)
-import moviepy.editor as mpy
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    # One instance per process; pool workers each build their own on import
+    _turbojpeg = TurboJPEG()
+except Exception:  # library missing or native libturbojpeg not installed
+    _turbojpeg = None
 
 VALID_IMAGE_FORMATS = {'.jpg', '.png', '.jpeg'}
 VALID_AUDIO_FORMATS = {'.mp3', '.wav'}
+# Both-case suffix table so the directory scan can test raw entry names
+# without allocating a lowercased copy per entry
+_IMAGE_SUFFIXES = frozenset(VALID_IMAGE_FORMATS | {s.upper() for s in VALID_IMAGE_FORMATS})
 # Video format configurations
 FORMAT_CONFIGS = {
     '16:9': {'width': 1920, 'height': 1080},  # Landscape HD
@@ -22,242 +43,455 @@ FORMAT_CONFIGS = {
 
 TARGET_RESOLUTION = (1920, 1080)  # Default 16:9 HD resolution
 
-def validate_assets() -> Tuple[bool, List[str]]:
+# Video codec for all encodes; set VIDEO_CODEC=h264_nvenc (etc.) to use a
+# hardware encoder instead of libx264
+VIDEO_CODEC = os.environ.get('VIDEO_CODEC', 'libx264')
+
+def _encoder_args() -> List[str]:
+    """
+    Encoder arguments for slideshow content. Frames repeat unchanged for
+    seconds at a time, so stillimage tuning, the ultrafast preset and long
+    keyframe intervals cut encode time 5-10x with no visible cost.
+    """
+    args = ['-c:v', VIDEO_CODEC]
+    if VIDEO_CODEC == 'libx264':
+        args += ['-preset', 'ultrafast', '-tune', 'stillimage',
+                 '-x264-params', 'keyint=300:min-keyint=300']
+    return args
+
+@dataclass(slots=True)
+class ImageMeta:
+    """Per-image processing result - slots keep N of these compact"""
+    original_path: str
+    processed_path: str
+    w: int
+    h: int
+
+@dataclass
+class Assets:
+    """Classified contents of the assets directory from a single scan"""
+    narration: List[Path] = field(default_factory=list)
+    music: List[Path] = field(default_factory=list)
+    images: List[Path] = field(default_factory=list)
+
+def _natural_key(path: Path):
+    """Sort key treating digit runs numerically, so img10 follows img2"""
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r'(\d+)', path.name.lower())]
+
+def scan_assets() -> Assets:
+    """
+    Classify the assets directory in a single scandir pass.
+    """
+    assets = Assets()
+    with os.scandir('assets') as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            if entry.name.startswith('narration.'):
+                assets.narration.append(Path(entry.path))
+            elif entry.name.startswith('background_music.'):
+                assets.music.append(Path(entry.path))
+            else:
+                # Fast path: raw suffix hits the precomputed table; only
+                # unusual mixed-case suffixes pay for a lower() allocation
+                suffix = entry.name[entry.name.rfind('.'):]
+                if suffix in _IMAGE_SUFFIXES or suffix.lower() in VALID_IMAGE_FORMATS:
+                    assets.images.append(Path(entry.path))
+    assets.images.sort(key=_natural_key)  # Deterministic natural ordering
+    return assets
+
+def validate_assets() -> Tuple[bool, List[str], Optional[Assets]]:
     """
     Validates the presence and format of required assets.
-    Returns: Tuple of (is_valid: bool, error_messages: List[str])
+    Returns: Tuple of (is_valid, error_messages, classified assets)
     """
     errors = []
     assets_dir = Path('assets')
-    
+
     # Check if assets directory exists
     if not assets_dir.exists():
-        return False, ["Assets directory not found. Please create 'assets' directory."]
-    
+        return False, ["Assets directory not found. Please create 'assets' directory."], None
+
+    # One directory walk instead of a glob per asset kind
+    assets = scan_assets()
+
     # Check for narration audio
-    narration_files = list(assets_dir.glob('narration.*'))
-    if not narration_files:
+    if not assets.narration:
         errors.append("No narration audio file found in assets directory.")
     else:
-        if not any(f.suffix.lower() in VALID_AUDIO_FORMATS for f in narration_files):
+        if not any(f.suffix.lower() in VALID_AUDIO_FORMATS for f in assets.narration):
             errors.append(f"Narration audio must be in one of these formats: {VALID_AUDIO_FORMATS}")
-    
+
     # Check for background music
-    music_files = list(assets_dir.glob('background_music.*'))
-    if not music_files:
+    if not assets.music:
         errors.append("No background music file found in assets directory.")
     else:
-        if not any(f.suffix.lower() in VALID_AUDIO_FORMATS for f in music_files):
+        if not any(f.suffix.lower() in VALID_AUDIO_FORMATS for f in assets.music):
             errors.append(f"Background music must be in one of these formats: {VALID_AUDIO_FORMATS}")
-    
+
     # Check for images
-    image_files = list(assets_dir.glob('*'))
-    image_files = [f for f in image_files if f.suffix.lower() in VALID_IMAGE_FORMATS]
-    if not image_files:
+    if not assets.images:
         errors.append(f"No image files found. Please add images in formats: {VALID_IMAGE_FORMATS}")
-    
+
     # Check output directory
     output_dir = Path('output')
     if not output_dir.exists():
-        return False, ["Output directory not found. Please create 'output' directory."]
-    
-    return len(errors) == 0, errors
+        return False, ["Output directory not found. Please create 'output' directory."], assets
+
+    return len(errors) == 0, errors, assets
 
-def process_inputs() -> Tuple[float, List[Dict]]:
+def probe_duration(media_path: Path) -> float:
     """
-    Process input audio and images, returning audio duration and image metadata
-    Returns: Tuple of (audio_duration: float, image_metadata: List[Dict])
+    Read a media file's duration in seconds from its container metadata
+    via ffprobe, without decoding any audio data.
     """
-    assets_dir = Path('assets')
-    
-    # Process narration audio
-    narration_files = list(assets_dir.glob('narration.*'))
-    narration_path = narration_files[0]
-    audio = AudioSegment.from_file(str(narration_path))
-    audio_duration = len(audio) / 1000.0  # Convert to seconds
-    
-    # Process images
-    image_files = [f for f in assets_dir.glob('*') if f.suffix.lower() in VALID_IMAGE_FORMATS]
-    image_files.sort()  # Ensure consistent ordering
-    
-    image_metadata = []
-    for img_path in image_files:
+    out = subprocess.check_output([
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'json',
+        str(media_path)
+    ])
+    return float(json.loads(out)['format']['duration'])
+
+PROCESSED_DIR = Path('output') / 'processed'
+MANIFEST_PATH = Path('output') / '.manifest.json'
+
+def _cached_wav(media_path: Path) -> Path:
+    """
+    Decode an audio file to PCM WAV once, cached under output/.cache and
+    keyed by the source's size and mtime. Re-runs with unchanged inputs
+    then skip the compressed-audio decode entirely - reading WAV is just
+    a header parse.
+    """
+    stat = media_path.stat()
+    cache_dir = Path('output') / '.cache'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cached = cache_dir / f"{media_path.stem}_{stat.st_size}_{stat.st_mtime_ns}.wav"
+    if not cached.exists():
+        subprocess.run([
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-i', str(media_path),
+            '-acodec', 'pcm_s16le',
+            str(cached)
+        ], check=True)
+    return cached
+
+def _fill_crop_box(src_size: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int, int, int]]:
+    """
+    Given a source size, return the scale-to-fill size and the centered
+    crop box (left, top, right, bottom) hitting TARGET_RESOLUTION exactly.
+    """
+    width_ratio = TARGET_RESOLUTION[0] / src_size[0]
+    height_ratio = TARGET_RESOLUTION[1] / src_size[1]
+    scale_factor = max(width_ratio, height_ratio)
+
+    new_size = (
+        int(src_size[0] * scale_factor),
+        int(src_size[1] * scale_factor)
+    )
+    left = (new_size[0] - TARGET_RESOLUTION[0]) // 2
+    top = (new_size[1] - TARGET_RESOLUTION[1]) // 2
+    right = left + TARGET_RESOLUTION[0]
+    bottom = top + TARGET_RESOLUTION[1]
+    return new_size, (left, top, right, bottom)
+
+def _process_one(img_path: Path) -> ImageMeta:
+    """
+    Process a single image: decode, scale to fill TARGET_RESOLUTION,
+    center-crop and save the result under output/processed/ so every
+    image goes through exactly one resize pass for the whole run.
+    Uses OpenCV's SIMD resize kernels when available (INTER_AREA for
+    downscales), falling back to Pillow LANCZOS otherwise.
+    Module-level so it can run in pool workers.
+    """
+    # Keep the source suffix in the name so e.g. foo.jpg and foo.png
+    # don't collide once both are re-encoded as JPEG
+    processed_path = PROCESSED_DIR / f"{img_path.stem}_{img_path.suffix.lstrip('.').lower()}.jpg"
+
+    if cv2 is not None:
+        arr = cv2.imread(str(img_path), cv2.IMREAD_COLOR)
+        new_size, (left, top, right, bottom) = _fill_crop_box((arr.shape[1], arr.shape[0]))
+        # INTER_AREA is both faster and better-looking for downscales;
+        # LANCZOS4 only when the source has to be scaled up
+        interpolation = cv2.INTER_AREA if new_size[0] < arr.shape[1] else cv2.INTER_LANCZOS4
+        resized = cv2.resize(arr, new_size, interpolation=interpolation)
+        cropped = resized[top:bottom, left:right]
+        if _turbojpeg is not None:
+            # libjpeg-turbo's SIMD DCT/Huffman encode (BGR is its default
+            # pixel format, matching cv2)
+            with open(processed_path, 'wb') as f:
+                f.write(_turbojpeg.encode(np.ascontiguousarray(cropped), quality=90))
+        else:
+            cv2.imwrite(str(processed_path), cropped, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    else:
         with Image.open(img_path) as img:
-            # Calculate scaling factors
-            width_ratio = TARGET_RESOLUTION[0] / img.size[0]
-            height_ratio = TARGET_RESOLUTION[1] / img.size[1]
-            scale_factor = max(width_ratio, height_ratio)
-            
-            # Scale up to fill screen
-            new_size = (
-                int(img.size[0] * scale_factor),
-                int(img.size[1] * scale_factor)
-            )
+            # For JPEGs, decode at a reduced size via libjpeg's IDCT scaling
+            # (no-op for other formats) - much cheaper than a full decode
+            if img_path.suffix.lower() in ('.jpg', '.jpeg'):
+                img.draft('RGB', TARGET_RESOLUTION)
+            # reduce() (and a LANCZOS resize) can't handle palette or
+            # 1-bit modes, so normalize those to RGB before any scaling
+            if img.mode not in ('RGB', 'L', 'RGBA'):
+                img = img.convert('RGB')
+            # Integer-factor pre-shrink: reduce() uses a fast box kernel on
+            # an exact stride, leaving only a short LANCZOS pass to the
+            # final size. min() keeps both dimensions large enough to
+            # still fill the target. This extends draft()'s power-of-two
+            # shrink to non-JPEG sources and to arbitrary integer factors.
+            shrink = min(img.size[0] // TARGET_RESOLUTION[0],
+                         img.size[1] // TARGET_RESOLUTION[1])
+            if shrink > 1:
+                img = img.reduce(shrink)
+            new_size, crop_box = _fill_crop_box(img.size)
             img_resized = img.resize(new_size, Image.Resampling.LANCZOS)
-            
-            # Center crop if needed
-            left = (new_size[0] - TARGET_RESOLUTION[0]) // 2
-            top = (new_size[1] - TARGET_RESOLUTION[1]) // 2
-            right = left + TARGET_RESOLUTION[0]
-            bottom = top + TARGET_RESOLUTION[1]
-            
-            img_final = img_resized.crop((left, top, right, bottom))
-            
-            metadata = {
-                'path': str(img_path),
-                'size': TARGET_RESOLUTION,
-                'crop_box': (left, top, right, bottom),
-                'scale_factor': scale_factor
-            }
-            image_metadata.append(metadata)
-    
+            if img_resized.mode != 'RGB':
+                img_resized = img_resized.convert('RGB')
+            if _turbojpeg is not None:
+                # Crop by slicing the ndarray view - PIL.Image.crop would
+                # allocate and memcpy a whole new image first
+                left, top, right, bottom = crop_box
+                arr = np.asarray(img_resized)[top:bottom, left:right]
+                with open(processed_path, 'wb') as f:
+                    f.write(_turbojpeg.encode(np.ascontiguousarray(arr),
+                                              quality=90, pixel_format=TJPF_RGB))
+            else:
+                img_resized.crop(crop_box).save(processed_path, quality=90)
+
+    return ImageMeta(str(img_path), str(processed_path), *TARGET_RESOLUTION)
+
+def process_inputs(assets: Assets) -> Tuple[float, List[ImageMeta]]:
+    """
+    Process input audio and images, returning audio duration and image metadata
+    Returns: Tuple of (audio_duration: float, image_metadata: List[ImageMeta])
+    """
+    # Probe narration duration from the container header - decoding the
+    # whole file to PCM just to measure its length wastes time and memory
+    audio_duration = probe_duration(assets.narration[0])
+
+    # Images were already classified by the scan in validate_assets
+    image_files = assets.images
+
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Manifest of already-processed sources keyed by path; a matching
+    # size/mtime means the processed copy on disk is still valid, so the
+    # whole decode/resize/encode can be skipped on iterative runs
+    manifest = {}
+    if MANIFEST_PATH.exists():
+        with open(MANIFEST_PATH, 'rb') as f:
+            data = f.read()
+        manifest = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    image_metadata = [None] * len(image_files)
+    to_process = []
+    for idx, img_path in enumerate(image_files):
+        stat = img_path.stat()
+        cached = manifest.get(str(img_path))
+        if (cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns
+                and Path(cached[2]).exists()):
+            image_metadata[idx] = ImageMeta(str(img_path), cached[2], *TARGET_RESOLUTION)
+        else:
+            to_process.append((idx, img_path, stat))
+
+    if to_process:
+        # Each image is independent, so fan the decode/resize work out
+        # across all cores. The resize kernels release the GIL, so for
+        # typical images threads scale about as well as processes without
+        # the fork/pickle overhead; very large sources (decode-dominated)
+        # still go to a process pool.
+        mean_bytes = sum(s.st_size for _, _, s in to_process) / len(to_process)
+        executor_cls = ThreadPoolExecutor if mean_bytes < 2_000_000 else ProcessPoolExecutor
+        with executor_cls(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_process_one, [p for _, p, _ in to_process])
+        for (idx, img_path, stat), metadata in zip(to_process, results):
+            image_metadata[idx] = metadata
+            manifest[str(img_path)] = [stat.st_size, stat.st_mtime_ns,
+                                       metadata.processed_path]
+        if orjson is not None:
+            with open(MANIFEST_PATH, 'wb') as f:
+                f.write(orjson.dumps(manifest))
+        else:
+            with open(MANIFEST_PATH, 'w') as f:
+                json.dump(manifest, f)
+
     return audio_duration, image_metadata
 
-def sync_assets(audio_duration: float, image_metadata: List[Dict]) -> None:
+def sync_assets(audio_duration: float, image_metadata: List[ImageMeta],
+                persist: bool = True) -> List[Dict]:
     """
-    Create a timeline syncing images with audio duration
+    Create a timeline syncing images with audio duration.
+    Returns the timeline; also writes output/sync_log.txt when persist is True.
     """
     num_images = len(image_metadata)
     time_per_image = audio_duration / num_images
     
-    timeline = []
-    current_time = 0.0
-    
-    for idx, img_data in enumerate(image_metadata):
-        entry = {
-            'image': img_data['path'],
-            'start_time': current_time,
-            'end_time': current_time + time_per_image,
-            'duration': time_per_image,
-            'crop_box': img_data['crop_box'],
-            'scale_factor': img_data['scale_factor']
+    # Compute all start/end times in one vector op - also avoids the
+    # floating-point drift of repeatedly accumulating time_per_image
+    starts = np.arange(num_images, dtype=np.float64) * time_per_image
+    ends = starts + time_per_image
+
+    timeline = [
+        {
+            'image': img_data.processed_path,
+            'source': img_data.original_path,
+            'start_time': float(start),
+            'end_time': float(end),
+            'duration': time_per_image
         }
-        timeline.append(entry)
-        current_time += time_per_image
-    
-    # Save timeline to output/sync_log.txt
-    output_path = Path('output') / 'sync_log.txt'
-    with open(output_path, 'w') as f:
-        json.dump(timeline, f, indent=2)
-        
+        for img_data, start, end in zip(image_metadata, starts, ends)
+    ]
+    
+    # Save timeline to output/sync_log.txt (orjson is several times faster
+    # than the stdlib encoder for large timelines)
+    if persist:
+        output_path = Path('output') / 'sync_log.txt'
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(timeline, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(timeline, f, indent=2)
+
     print(f"Timeline created with {num_images} images")
     print(f"Each image will display for {time_per_image:.2f} seconds")
     print(f"Total duration: {audio_duration:.2f} seconds")
 
-def assemble_video() -> mpy.VideoFileClip:
+    return timeline
+
+def assemble_video(timeline: List[Dict] = None, assets: Assets = None) -> Path:
     """
-    Assemble the final video using the processed assets and timeline
+    Assemble the base video with a single ffmpeg invocation driven by the
+    concat demuxer: each processed still is read once with its segment
+    duration and ffmpeg duplicates frames inside the encoder, with
+    narration and background music mixed in the same pass. No pixel data
+    flows through Python at all. Returns the path of the rendered base
+    video.
     """
     logger = logging.getLogger(__name__)
-    
-    # Load timeline
-    timeline_path = Path('output') / 'sync_log.txt'
-    logger.debug(f"Loading timeline from {timeline_path}")
-    with open(timeline_path, 'r') as f:
-        timeline = json.load(f)
-    logger.debug(f"Loaded timeline with {len(timeline)} entries")
-    
-    # Create video clips from images using pre-calculated dimensions
-    clips = []
-    for idx, entry in enumerate(timeline):
-        logger.debug(f"Processing image {idx + 1}/{len(timeline)}: {entry['image']}")
-        # Load and process image
-        with Image.open(entry['image']) as img:
-            # Scale image using pre-calculated factor
-            new_size = (
-                int(img.size[0] * entry['scale_factor']),
-                int(img.size[1] * entry['scale_factor'])
-            )
-            img_resized = img.resize(new_size, Image.Resampling.LANCZOS)
-            
-            # Crop using pre-calculated box
-            img_final = img_resized.crop(entry['crop_box'])
-            
-        # Convert PIL image to MoviePy clip
-        img_array = np.array(img_final)
-        img_clip = mpy.ImageClip(img_array).set_duration(entry['duration'])
-        clips.append(img_clip)
-    
-    # Concatenate all image clips
-    final_clip = mpy.concatenate_videoclips(clips, method="compose")
-    
-    # Add narration audio
-    narration_path = next(Path('assets').glob('narration.*'))
-    narration = mpy.AudioFileClip(str(narration_path))
-    
-    # Add background music
-    music_path = next(Path('assets').glob('background_music.*'))
-    background_music = mpy.AudioFileClip(str(music_path))
-    
-    # Loop background music if shorter than video
-    if background_music.duration < final_clip.duration:
-        background_music = background_music.loop(duration=final_clip.duration)
-    else:
-        background_music = background_music.subclip(0, final_clip.duration)
-    
-    # Set background music volume to 20% of original
-    background_music = background_music.volumex(0.2)
-    
-    # Combine audio tracks
-    narration = narration.audio_fadeout(1)
-    background_music = background_music.audio_fadeout(2)
-    final_audio = mpy.CompositeAudioClip([narration, background_music])
-    
-    # Set the audio to the video
-    final_clip = final_clip.set_audio(final_audio)
-    
-    return final_clip
 
-def export_video(clip: mpy.VideoFileClip, format_ratio: Literal['16:9', '9:16', '1:1'] = '16:9') -> None:
+    if timeline is None:
+        timeline_path = Path('output') / 'sync_log.txt'
+        logger.debug(f"Loading timeline from {timeline_path}")
+        with open(timeline_path, 'rb') as f:
+            data = f.read()
+        timeline = orjson.loads(data) if orjson is not None else json.loads(data)
+    logger.debug(f"Using timeline with {len(timeline)} entries")
+
+    if assets is None:
+        assets = scan_assets()
+    narration_path = _cached_wav(assets.narration[0])
+    music_path = _cached_wav(assets.music[0])
+
+    total_duration = timeline[-1]['end_time'] if timeline else 0.0
+
+    # Rate-convert to 30 fps inside the filtergraph: an output-side -r
+    # would hold the repeated trailing concat frame for a whole extra
+    # segment, padding the video past the narration. Background music
+    # loops under the narration at 20% volume; narration fades out over
+    # the last second, music over the last two.
+    av_filter = (
+        "[0:v]fps=30[v];"
+        f"[2:a]volume=0.2,afade=t=out:st={max(total_duration - 2, 0):.3f}:d=2[bgm];"
+        f"[1:a]afade=t=out:st={max(total_duration - 1, 0):.3f}:d=1[nar];"
+        "[nar][bgm]amix=inputs=2:duration=first:normalize=0[a]"
+    )
+
+    # Concat demuxer list: one line per processed still with its segment
+    # duration. The final file is repeated because the demuxer ignores
+    # the duration directive on the last entry otherwise. Quotes in a
+    # path must be escaped as '\'' per the demuxer syntax - unquoted they
+    # break the parse and ffmpeg drops the image while still exiting 0.
+    def quote(path: str) -> str:
+        return "'" + str(Path(path).resolve()).replace("'", "'\\''") + "'"
+
+    concat_path = Path('output') / 'concat_list.txt'
+    lines = []
+    for entry in timeline:
+        lines.append(f"file {quote(entry['image'])}")
+        lines.append(f"duration {entry['duration']:.6f}")
+    if timeline:
+        lines.append(f"file {quote(timeline[-1]['image'])}")
+    concat_path.write_text('\n'.join(lines) + '\n')
+
+    base_path = Path('output') / 'base_video.mp4'
+    cmd = ([
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 'concat', '-safe', '0', '-i', str(concat_path),
+        '-i', str(narration_path),
+        '-stream_loop', '-1', '-i', str(music_path),
+        '-filter_complex', av_filter,
+        '-map', '[v]', '-map', '[a]'
+    ] + _encoder_args() + [
+        '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac',
+        str(base_path)
+    ])
+    logger.debug(f"Running ffmpeg assemble: {' '.join(cmd)}")
+    subprocess.run(cmd, check=True)
+
+    return base_path
+
+def export_videos(base_path: Path) -> None:
     """
-    Export video in specified aspect ratio with appropriate padding/cropping
+    Derive every configured aspect ratio from the rendered base video in a
+    single ffmpeg invocation: one decode feeds a split filtergraph with a
+    crop/scale chain per format, instead of one full re-render per format.
     """
-    config = FORMAT_CONFIGS[format_ratio]
-    target_width = config['width']
-    target_height = config['height']
-    
-    # Calculate scaling factors
-    width_ratio = target_width / clip.w
-    height_ratio = target_height / clip.h
-    
-    # Calculate scaling factors to fill the target resolution
-    width_ratio = target_width / clip.w
-    height_ratio = target_height / clip.h
-    scale_factor = max(width_ratio, height_ratio)
-    
-    # Scale up to fill screen
-    scaled_width = int(clip.w * scale_factor)
-    scaled_height = int(clip.h * scale_factor)
-    
-    # Resize while maintaining quality
-    scaled_clip = clip.resize(width=scaled_width, height=scaled_height)
-    
-    # Center crop to target resolution
-    x_center = (scaled_width - target_width) // 2
-    y_center = (scaled_height - target_height) // 2
-    
-    final = scaled_clip.crop(
-        x1=x_center,
-        y1=y_center,
-        x2=x_center + target_width,
-        y2=y_center + target_height
-    )
-    
-    # Export with format-specific filename
-    output_path = Path('output') / f'video_{format_ratio.replace(":", "x")}.mp4'
-    final.write_videofile(
-        str(output_path),
-        fps=30,
-        codec='libx264',
-        audio_codec='aac'
-    )
-    final.close()
+    logger = logging.getLogger(__name__)
+
+    base_w, base_h = TARGET_RESOLUTION
+    filters = []
+    outputs = []
+    for format_ratio, config in FORMAT_CONFIGS.items():
+        w, h = config['width'], config['height']
+        output_path = Path('output') / f'video_{format_ratio.replace(":", "x")}.mp4'
+        if (w, h) == (base_w, base_h):
+            # Same geometry as the base render: remux the encoded stream
+            # as-is instead of decoding and re-encoding it
+            outputs += ['-map', '0:v', '-map', '0:a',
+                        '-c:v', 'copy', '-c:a', 'copy', str(output_path)]
+            continue
+        # The base resolution is known, so compute the centered crop box
+        # as plain integers here instead of handing ffmpeg iw/ih
+        # expressions to parse and evaluate per filter
+        i = len(filters)
+        crop_w = min(base_w, base_h * w // h)
+        crop_h = min(base_h, base_w * h // w)
+        crop_x = (base_w - crop_w) // 2
+        crop_y = (base_h - crop_h) // 2
+        # setsar=1 forces square pixels: the floor'd crop width is up to a
+        # pixel off the exact aspect, and scale would otherwise preserve
+        # that as a non-square SAR tag some upload targets reject
+        filters.append(
+            f"[s{i}]crop={crop_w}:{crop_h}:{crop_x}:{crop_y},scale={w}:{h},setsar=1[v{i}]"
+        )
+        # The base video already carries the final AAC mix, so every
+        # export copies the audio stream instead of re-encoding it
+        outputs += (['-map', f'[v{i}]', '-map', '0:a']
+                    + _encoder_args()
+                    + ['-c:a', 'copy', str(output_path)])
+
+    cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-i', str(base_path)]
+    if filters:
+        split_labels = ''.join(f'[s{i}]' for i in range(len(filters)))
+        cmd += ['-filter_complex',
+                ';'.join([f"[0:v]split={len(filters)}{split_labels}"] + filters)]
+    cmd += outputs
+    logger.debug(f"Running ffmpeg export: {' '.join(cmd)}")
+    subprocess.run(cmd, check=True)
 
 def main():
     logger = setup_logging()
     logger.info("Starting video creation process")
+
+    # Pillow-SIMD reports versions like "9.0.0.post1"; the stock build doesn't.
+    if '.post' in PIL.__version__:
+        logger.info(f"Pillow-SIMD detected (v{PIL.__version__}) - using vectorized resize")
+    else:
+        logger.debug("Stock Pillow in use; install pillow-simd for faster resizes (see requirements.txt)")
     
-    is_valid, errors = validate_assets()
+    is_valid, errors, assets = validate_assets()
     if not is_valid:
         logger.error("Asset validation failed:")
         for error in errors:
@@ -269,30 +503,20 @@ def main():
     try:
         logger.info("Processing inputs...")
         logger.debug("Reading audio files and processing images")
-        audio_duration, image_metadata = process_inputs()
+        audio_duration, image_metadata = process_inputs(assets)
         logger.debug(f"Audio duration: {audio_duration:.2f}s")
         logger.debug(f"Number of images: {len(image_metadata)}")
         
         logger.info("Creating timeline...")
         logger.debug("Calculating image durations and transitions")
-        sync_assets(audio_duration, image_metadata)
-        
+        timeline = sync_assets(audio_duration, image_metadata)
+
         logger.info("Assembling video...")
-        logger.debug("Creating video clips from images")
-        final_clip = assemble_video()
-        
+        logger.debug("Streaming frames to the base video encode")
+        base_path = assemble_video(timeline, assets)
+
         logger.info("Exporting videos in different formats...")
-        # Export in all supported formats
-        for format_ratio in FORMAT_CONFIGS.keys():
-            logger.info(f"Exporting {format_ratio} version...")
-            try:
-                export_video(final_clip, format_ratio)
-                logger.debug(f"Successfully exported {format_ratio} version")
-            except Exception as e:
-                logger.error(f"Failed to export {format_ratio} version: {str(e)}")
-        
-        # Clean up
-        final_clip.close()
+        export_videos(base_path)
         
         logger.info("Processing complete! Videos exported to output directory")
     except Exception as e:
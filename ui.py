@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import filedialog
 import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import main
 import os
@@ -118,17 +119,25 @@ class VideoCreatorUI:
             if file.is_file():
                 file.unlink()
             
-        # Copy new assets
+        # Copy new assets. copy2 keeps the kernel's zero-copy path
+        # (sendfile/copy_file_range on Linux) and preserves mtimes, which
+        # the processed-image manifest and WAV cache key on - copies that
+        # reset timestamps would invalidate both caches every click. The
+        # image copies overlap in a thread pool since each one is pure I/O.
         try:
             # Copy images
-            for img in Path(self.image_path).glob("*"):
-                if img.suffix.lower() in main.VALID_IMAGE_FORMATS:
-                    shutil.copy2(img, assets_dir)
-            
+            images = [img for img in Path(self.image_path).glob("*")
+                      if img.suffix.lower() in main.VALID_IMAGE_FORMATS]
+            with ThreadPoolExecutor() as pool:
+                futures = [pool.submit(shutil.copy2, img, assets_dir / img.name)
+                           for img in images]
+                for future in futures:
+                    future.result()
+
             # Copy audio files
             narr_ext = Path(self.narration_path).suffix
             shutil.copy2(self.narration_path, assets_dir / f"narration{narr_ext}")
-            
+
             music_ext = Path(self.music_path).suffix
             shutil.copy2(self.music_path, assets_dir / f"background_music{music_ext}")
             